@@ -1,14 +1,50 @@
+import asyncio
+import functools
 import json
 import os
+import sqlite3
+from html.parser import HTMLParser
+
+try:
+    import aiohttp
+except ImportError:
+    # aiohttp is optional; only the async fetchers below need it, and the
+    # rest of the module (cache I/O, sync fetchers) works without it.
+    aiohttp = None
+
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
 
+CACHE_FILENAME = "airport_cache.jsonl"
+CACHE_DB_FILENAME = "airport_cache.sqlite"
 
-CACHE_FILENAME = "airport_cache.json"
+WIKI_BASE_URL = "https://en.wikipedia.org/wiki/"
+WIKI_API_URL = "https://en.wikipedia.org/w/api.php"
+
+USER_AGENT = "UMSI-507-Project (your_email@umich.edu)"
+
+# One shared session: keep-alive reuses the TCP+TLS connection to Wikipedia
+# across fetches instead of paying a fresh handshake per airport.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=10,
+                max_retries=Retry(total=2, backoff_factor=0.5)),
+)
 
 
 def load_cache(filename: str = CACHE_FILENAME) -> dict:
     """
-    Load the JSON cache file if it exists, otherwise return an empty dict.
+    Load the cache file if it exists, otherwise return an empty dict.
+
+    The on-disk format is JSON Lines: one {"code": ..., "info": {...}} entry
+    per line. Later lines win, so an appended update simply supersedes the
+    old entry on the next load. If the *first* line is not a JSON Lines
+    entry the file is read as an old-style whole-file JSON cache instead;
+    a bad line later in the file (e.g. an append torn by a crash) is
+    skipped with a warning so the surviving entries are kept.
 
     Parameters
     ----------
@@ -23,10 +59,31 @@ def load_cache(filename: str = CACHE_FILENAME) -> dict:
     if not os.path.exists(filename):
         return {}
 
+    cache = {}
     try:
         with open(filename, "r", encoding="utf-8") as f:
-            cache = json.load(f)
-    except (json.JSONDecodeError, OSError):
+            first_entry = True
+            for lineno, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    cache[entry["code"]] = entry["info"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    if first_entry:
+                        # Not JSON Lines at all: old format, one big JSON
+                        # dict for the whole file.
+                        f.seek(0)
+                        try:
+                            return json.load(f)
+                        except (json.JSONDecodeError, OSError):
+                            return {}
+                    print(f"Warning: skipping unparseable cache line "
+                          f"{lineno} in {filename}")
+                    continue
+                first_entry = False
+    except OSError:
         cache = {}
 
     return cache
@@ -34,7 +91,10 @@ def load_cache(filename: str = CACHE_FILENAME) -> dict:
 
 def save_cache(cache: dict, filename: str = CACHE_FILENAME) -> None:
     """
-    Save the cache dictionary to a JSON file.
+    Save the cache dictionary to disk as JSON Lines (one entry per line).
+
+    The file is opened with a 1 MiB write buffer so the (potentially large)
+    dump goes to disk in a few big write() calls instead of many tiny ones.
 
     Parameters
     ----------
@@ -43,10 +103,230 @@ def save_cache(cache: dict, filename: str = CACHE_FILENAME) -> None:
     filename : str
         Path to the cache file.
     """
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
+    with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
+        for code, info in cache.items():
+            save_cache_append(code, info, f)
+
+
+def save_cache_append(code: str, info: dict, fh) -> None:
+    """
+    Append a single cache entry as one JSON line to an open file handle.
+
+    Appending one line is O(entry size) instead of O(cache size), so a bulk
+    run that adds N entries writes O(N) bytes total rather than rewriting
+    the whole file N times.
+
+    Parameters
+    ----------
+    code : str
+        IATA airport code (the cache key).
+    info : dict
+        The cached info for this airport.
+    fh : file object
+        An open text-mode file handle. For bulk runs, open it once with
+        a big buffer, e.g. open(filename, "a", encoding="utf-8",
+        buffering=1<<20), and keep it open across calls.
+    """
+    fh.write(json.dumps({"code": code, "info": info}, ensure_ascii=False,
+                        separators=(",", ":")) + "\n")
+
+
+def compact_cache(filename: str = CACHE_FILENAME) -> None:
+    """
+    Rewrite the cache file, dropping superseded duplicate lines.
+
+    After a long append-only run the file can contain several lines for the
+    same airport; loading keeps only the latest, and this rewrites the file
+    to match.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the cache file.
+    """
+    save_cache(load_cache(filename), filename)
+
+
+class SQLiteCache:
+    """
+    Dict-like airport cache backed by SQLite.
+
+    Unlike the JSON Lines file, updating one airport is a single O(1)
+    INSERT OR REPLACE (no file rewrite or growing log), lookups are lazy
+    (no upfront load of the whole cache), and several processes can fetch
+    concurrently against the same database.
+
+    The fetch helpers only use `in`, indexing and get(), so an instance can
+    be passed anywhere they accept a cache dict:
+
+        cache = SQLiteCache()
+        info, cache = fetch_airport_wiki(airport, cache=cache)
+
+    Parameters
+    ----------
+    filename : str
+        Path to the SQLite database file.
+    commit_every : int
+        Commit automatically after this many writes; flush_cache (or
+        commit()) forces one at the end of a run.
+    """
+
+    def __init__(self, filename: str = CACHE_DB_FILENAME, commit_every: int = 100):
+        self._conn = sqlite3.connect(filename)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (code TEXT PRIMARY KEY, info TEXT)"
+        )
+        self._conn.commit()
+        self.commit_every = commit_every
+        self._pending = 0
+
+    def __contains__(self, code) -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM cache WHERE code = ?", (code,)
+        ).fetchone()
+        return row is not None
+
+    def __getitem__(self, code) -> dict:
+        row = self._conn.execute(
+            "SELECT info FROM cache WHERE code = ?", (code,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(code)
+        return json.loads(row[0])
+
+    def get(self, code, default=None):
+        try:
+            return self[code]
+        except KeyError:
+            return default
+
+    def __setitem__(self, code, info: dict) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache (code, info) VALUES (?, ?)",
+            (code, json.dumps(info, ensure_ascii=False, separators=(",", ":"))),
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def items(self):
+        for code, info in self._conn.execute("SELECT code, info FROM cache"):
+            yield code, json.loads(info)
+
+    def commit(self) -> None:
+        self._conn.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        self.commit()
+        self._conn.close()
+
+
+def dump_cache_to_json(db_filename: str = CACHE_DB_FILENAME,
+                       json_filename: str = CACHE_FILENAME) -> None:
+    """
+    Export a SQLite cache to the JSON Lines format for human inspection.
+
+    Parameters
+    ----------
+    db_filename : str
+        Path to the SQLite database file.
+    json_filename : str
+        Path of the JSON Lines file to write.
+    """
+    cache = SQLiteCache(db_filename)
+    try:
+        save_cache(dict(cache.items()), json_filename)
+    finally:
+        cache.close()
+
+
+def flush_cache(cache, filename: str = CACHE_FILENAME) -> None:
+    """
+    Write the in-memory cache to disk in one shot.
+
+    Use this together with `fetch_airport_wiki(..., autosave=False)` when
+    fetching many airports in a row: instead of rewriting the whole JSON file
+    after every airport, callers can flush once at the end (or every K
+    airports), so total bytes written stay O(cache size) instead of O(N^2).
+    For a SQLiteCache this is just a commit of the pending writes.
+
+    Parameters
+    ----------
+    cache : dict or SQLiteCache
+        The cache to save.
+    filename : str
+        Path to the cache file (ignored for SQLiteCache).
+    """
+    if isinstance(cache, SQLiteCache):
+        cache.commit()
+    else:
+        save_cache(cache, filename)
+
+
+class _LeadExtractor(HTMLParser):
+    """Collects the text of the top-level <p> paragraphs of an HTML page."""
+
+    def __init__(self):
+        super().__init__()
+        self.paragraphs = []
+        self._depth = 0
+        self._buf = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "p":
+            self._depth += 1
+
+    def handle_endtag(self, tag):
+        if tag == "p" and self._depth:
+            self._depth -= 1
+            if self._depth == 0:
+                text = "".join(self._buf).strip()
+                self._buf = []
+                if text:
+                    self.paragraphs.append(text)
+
+    def handle_data(self, data):
+        if self._depth:
+            self._buf.append(data)
+
+
+def _extract_lead(html_text: str, max_paragraphs: int = 3) -> str | None:
+    """
+    Extract the lead section (first few paragraphs) from a Wikipedia page.
+
+    A full rendered article is 100-500 KB; caching thousands of those blows
+    the cache file up into hundreds of MB. The lead paragraphs are the part
+    we actually show, and they are only a few KB.
+
+    Parameters
+    ----------
+    html_text : str
+        Raw HTML of the page.
+    max_paragraphs : int
+        How many paragraphs of the lead to keep.
+
+    Returns
+    -------
+    str or None
+        The lead text, or None if no paragraph text could be found.
+    """
+    parser = _LeadExtractor()
+    try:
+        parser.feed(html_text)
+    except Exception:
+        return None
+
+    if not parser.paragraphs:
+        return None
 
+    return "\n\n".join(parser.paragraphs[:max_paragraphs])
 
+
+@functools.lru_cache(maxsize=None)
 def _guess_wiki_title(airport_name: str) -> str:
     """
     A very rough guess for a Wikipedia page title based on airport name.
@@ -59,12 +339,15 @@ def _guess_wiki_title(airport_name: str) -> str:
     return airport_name.replace(" ", "_")
 
 
-def fetch_airport_wiki(airport, cache: dict | None = None, filename: str = CACHE_FILENAME) -> tuple[dict, dict]:
+def fetch_airport_wiki(airport, cache: dict | None = None, filename: str = CACHE_FILENAME,
+                       autosave: bool = True) -> tuple[dict, dict]:
     """
     Fetch (or retrieve from cache) a small piece of extra info about an airport.
 
-    For now, this tries to download the raw HTML of the guessed Wikipedia page
-    and stores it in the cache with the airport IATA code as the key.
+    This downloads the guessed Wikipedia page, keeps just its lead section,
+    and stores it in the cache with the airport IATA code as the key. Failed
+    lookups are cached as {"wiki_url": ..., "html": None, "status": "missing"}
+    so they are not retried every run.
 
     Parameters
     ----------
@@ -75,11 +358,17 @@ def fetch_airport_wiki(airport, cache: dict | None = None, filename: str = CACHE
         from disk and also return the updated cache.
     filename : str
         Cache filename to read/write.
+    autosave : bool
+        If True (default), append the new entry to the cache file right
+        away. Pass False when looping over many airports and call
+        flush_cache() once at the end instead.
 
     Returns
     -------
     info : dict
-        A dictionary like {"wiki_url": ..., "html": ... or None}.
+        {"wiki_url": ..., "html": <lead text>} on success, or
+        {"wiki_url": ..., "html": None, "status": "missing"} if the page
+        could not be fetched.
     cache : dict
         The updated cache dictionary.
     """
@@ -91,26 +380,232 @@ def fetch_airport_wiki(airport, cache: dict | None = None, filename: str = CACHE
     if code in cache:
         return cache[code], cache
 
-    base_url = "https://en.wikipedia.org/wiki/"
-    title = _guess_wiki_title(airport.name)
-    url = base_url + title
+    url = WIKI_BASE_URL + _guess_wiki_title(airport.name)
 
     html_text = None
 
     try:
-        headers = {"User-Agent": "UMSI-507-Project (your_email@umich.edu)"}
-        resp = requests.get(url, timeout=10, headers = headers)
+        resp = _SESSION.get(url, timeout=10)
         resp.raise_for_status()
         html_text = resp.text
     except Exception:
         html_text = None
 
-    info = {
-        "wiki_url": url,
-        "html": html_text,
-    }
+    if html_text is None:
+        # Tiny sentinel; skipping the body keeps failed lookups (many
+        # guessed titles 404) small, but "html" stays present because
+        # consumers read info["html"] unconditionally.
+        info = {"wiki_url": url, "html": None, "status": "missing"}
+    else:
+        lead = _extract_lead(html_text)
+        info = {
+            "wiki_url": url,
+            "html": lead if lead is not None else html_text,
+        }
 
     cache[code] = info
-    save_cache(cache, filename)
+    if autosave:
+        if isinstance(cache, SQLiteCache):
+            cache.commit()
+        else:
+            with open(filename, "a", encoding="utf-8") as f:
+                save_cache_append(code, info, f)
 
     return info, cache
+
+
+async def fetch_airport_wiki_async(airport, session, cache: dict) -> dict:
+    """
+    Async version of fetch_airport_wiki for one airport.
+
+    Only mutates the in-memory cache; callers are responsible for saving
+    (see fetch_many, which flushes once at the end).
+
+    Parameters
+    ----------
+    airport : Airport
+        An Airport object (from your flight_network module).
+    session : aiohttp.ClientSession
+        Shared HTTP session (created by fetch_many).
+    cache : dict
+        Cache dictionary shared by all in-flight fetches. Safe to share
+        because all writes happen on the single event-loop thread.
+
+    Returns
+    -------
+    info : dict
+        {"wiki_url": ..., "html": <lead text>} on success, or
+        {"wiki_url": ..., "html": None, "status": "missing"} if the page
+        could not be fetched.
+    """
+    code = airport.code
+
+    if code in cache:
+        return cache[code]
+
+    url = WIKI_BASE_URL + _guess_wiki_title(airport.name)
+
+    html_text = None
+
+    try:
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with session.get(url, timeout=timeout) as resp:
+            resp.raise_for_status()
+            html_text = await resp.text()
+    except Exception:
+        html_text = None
+
+    if html_text is None:
+        # Tiny sentinel; skipping the body keeps failed lookups (many
+        # guessed titles 404) small, but "html" stays present because
+        # consumers read info["html"] unconditionally.
+        info = {"wiki_url": url, "html": None, "status": "missing"}
+    else:
+        lead = _extract_lead(html_text)
+        info = {
+            "wiki_url": url,
+            "html": lead if lead is not None else html_text,
+        }
+
+    cache[code] = info
+    return info
+
+
+async def fetch_many(airports, cache: dict | None = None, filename: str = CACHE_FILENAME,
+                     concurrency: int = 50, autosave: bool = True) -> dict:
+    """
+    Fetch wiki info for many airports concurrently.
+
+    The sync fetch_airport_wiki serializes on network latency (one request
+    at a time, up to 10 s each). This driver runs up to `concurrency`
+    requests at once, so a cold-cache run over N airports takes roughly
+    N / concurrency round-trips instead of N. Cached airports cost nothing.
+
+    Parameters
+    ----------
+    airports : iterable of Airport
+        Airport objects to look up.
+    cache : dict or None
+        Existing cache dictionary. If None, loaded from `filename`.
+    filename : str
+        Cache filename to read/write.
+    concurrency : int
+        Maximum number of simultaneous HTTP requests.
+    autosave : bool
+        If True (default), flush the cache to disk once after all fetches.
+
+    Returns
+    -------
+    cache : dict
+        The updated cache dictionary.
+    """
+    if aiohttp is None:
+        raise ImportError("aiohttp is required for fetch_many "
+                          "(pip install aiohttp)")
+
+    if cache is None:
+        cache = load_cache(filename)
+
+    sem = asyncio.Semaphore(concurrency)
+    headers = {"User-Agent": USER_AGENT}
+
+    async with aiohttp.ClientSession(headers=headers) as session:
+
+        async def fetch_one(airport):
+            async with sem:
+                return await fetch_airport_wiki_async(airport, session, cache)
+
+        await asyncio.gather(*(fetch_one(a) for a in airports))
+
+    if autosave:
+        flush_cache(cache, filename)
+
+    return cache
+
+
+def fetch_airports_wiki(airports, cache: dict | None = None, filename: str = CACHE_FILENAME,
+                        batch_size: int = 50, autosave: bool = True) -> dict:
+    """
+    Fetch Wikipedia summaries for many airports via the MediaWiki API.
+
+    The action API accepts up to 50 titles per request and returns just the
+    intro extract (a few KB) instead of the full rendered page (100-500 KB),
+    so this needs ~50x fewer round-trips and far less bandwidth than
+    fetching pages one by one.
+
+    Parameters
+    ----------
+    airports : iterable of Airport
+        Airport objects to look up. Already-cached codes are skipped.
+    cache : dict or None
+        Existing cache dictionary. If None, loaded from `filename`.
+    filename : str
+        Cache filename to read/write.
+    batch_size : int
+        Titles per API request (the API caps this at 50).
+    autosave : bool
+        If True (default), flush the cache to disk once at the end.
+
+    Returns
+    -------
+    cache : dict
+        The updated cache dictionary. Entries use the same schema as
+        fetch_airport_wiki: {"wiki_url": ..., "html": <intro text>} on
+        success or {"wiki_url": ..., "html": None, "status": "missing"}
+        when no page was found, so a cache warmed here serves both
+        fetchers' consumers.
+    """
+    if cache is None:
+        cache = load_cache(filename)
+
+    todo = [a for a in airports if a.code not in cache]
+
+    for start in range(0, len(todo), batch_size):
+        chunk = todo[start:start + batch_size]
+
+        params = {
+            "action": "query",
+            "prop": "extracts",
+            "exintro": 1,
+            "explaintext": 1,
+            "format": "json",
+            "titles": "|".join(_guess_wiki_title(a.name) for a in chunk),
+        }
+
+        try:
+            resp = _SESSION.get(WIKI_API_URL, params=params, timeout=10)
+            resp.raise_for_status()
+            pages = resp.json()["query"]["pages"]
+        except Exception:
+            # Leave this chunk uncached so a later run can retry it.
+            continue
+
+        # The API normalizes "Detroit_Metro..._Airport" back to the spaced
+        # form, which is exactly the airport name we guessed from.
+        by_name = {a.name: a for a in chunk}
+        matched = set()
+
+        for page in pages.values():
+            airport = by_name.get(page.get("title"))
+            if airport is None:
+                continue
+
+            url = WIKI_BASE_URL + _guess_wiki_title(airport.name)
+            extract = page.get("extract")
+            if extract:
+                cache[airport.code] = {"wiki_url": url, "html": extract}
+            else:
+                cache[airport.code] = {"wiki_url": url, "html": None,
+                                       "status": "missing"}
+            matched.add(airport.code)
+
+        for airport in chunk:
+            if airport.code not in matched:
+                url = WIKI_BASE_URL + _guess_wiki_title(airport.name)
+                cache[airport.code] = {"wiki_url": url, "html": None,
+                                       "status": "missing"}
+
+    if autosave:
+        flush_cache(cache, filename)
+
+    return cache
@@ -1,9 +1,154 @@
+import sys
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-from collections import defaultdict, deque
+from collections import defaultdict
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+try:
+    import polars as pl
+except ImportError:
+    # Polars is optional; the CSV reader below falls back to pandas.
+    pl = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernel below runs as plain Python.
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
 
 
+@lru_cache(maxsize=4096)
+def _norm(code):
+    """
+    Normalize a user-supplied IATA code ("lax " -> "LAX").
+
+    Interactive sessions hammer the same handful of codes, so the
+    strip/upper allocations are memoized; 4096 entries comfortably covers
+    every IATA code plus messy variants.
+    """
+    return code.strip().upper()
+
+
+def _read_csv_columns(csv_path, columns, float_cols=(), dropna_cols=()):
+    """
+    Read selected CSV columns and return them as {column: numpy array}.
+
+    Uses polars when installed: it parses the file in parallel across cores
+    with SIMD tokenization and no pandas block-manager overhead. Otherwise
+    falls back to pandas with the same usecols/dtype hints. Either way the
+    OpenFlights "\\N" placeholder is treated as NA and rows with NA in
+    `dropna_cols` are dropped.
+
+    Parameters
+    ----------
+    csv_path : str
+        Path to the CSV file.
+    columns : list of str
+        Columns to read (all others are skipped by the parser).
+    float_cols : tuple of str
+        Columns to parse as float64; the rest are read as strings.
+    dropna_cols : tuple of str
+        Rows with NA in any of these columns are dropped.
+
+    Returns
+    -------
+    dict[str, numpy.ndarray]
+        One array per requested column, all the same length.
+    """
+    if pl is not None:
+        df = pl.read_csv(
+            csv_path,
+            columns=list(columns),
+            null_values=[r"\N"],
+            schema_overrides={c: pl.Float64 for c in float_cols},
+        )
+        df = df.drop_nulls(subset=list(dropna_cols))
+        return {c: df[c].to_numpy() for c in columns}
+
+    # Pandas fallback: stream the file in chunks and filter each chunk
+    # before keeping it, so peak memory stays near the size of the rows
+    # that survive the NA filter rather than 2-3x the whole file. The
+    # OpenFlights files are small, but the same loader should cope with
+    # multi-million-row route dumps.
+    dtype = {c: ("float64" if c in float_cols else "string") for c in columns}
+    parts = []
+    for chunk in pd.read_csv(csv_path, usecols=list(columns), dtype=dtype,
+                             na_values=[r"\N"], chunksize=100_000):
+        parts.append(chunk.dropna(subset=list(dropna_cols)))
+    if not parts:
+        return {c: np.empty(0, dtype=object) for c in columns}
+    df = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+    return {c: df[c].to_numpy() for c in columns}
+
+
+@njit(cache=True)
+def _bfs_csr(indptr, indices, src_idx, dst_idx, parent):
+    """
+    BFS over a CSR graph from src_idx, filling `parent` in place.
+
+    `parent` doubles as the visited marker (-1 means unvisited; the source
+    points to itself). The queue is a preallocated int32 ring buffer so the
+    whole kernel is a tight numeric loop that Numba can compile.
+
+    Returns True if dst_idx was reached.
+    """
+    n = parent.shape[0]
+    for i in range(n):
+        parent[i] = -1
+
+    queue = np.empty(n, np.int32)
+    head = 0
+    tail = 0
+    queue[tail] = src_idx
+    tail += 1
+    parent[src_idx] = src_idx
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            if parent[neighbor] == -1:
+                parent[neighbor] = current
+                if neighbor == dst_idx:
+                    return True
+                queue[tail] = neighbor
+                tail += 1
+
+    return False
+
+
+@njit(cache=True)
+def _path_from_parent(parent, src_idx, dst_idx):
+    """
+    Walk parent links from dst_idx back to src_idx.
+
+    Fills a preallocated int32 buffer (a path can never exceed n nodes) and
+    returns the ids ordered src -> dst, so the caller only has to translate
+    ids to codes.
+    """
+    buf = np.empty(parent.shape[0], np.int32)
+    length = 0
+    node = dst_idx
+    while node != src_idx:
+        buf[length] = node
+        length += 1
+        node = parent[node]
+    buf[length] = src_idx
+    length += 1
+    return buf[:length][::-1]
+
 
 class Airport:
     """
@@ -33,7 +178,19 @@ class Airport:
         A list of Route objects representing all incoming routes (destinations → this airport).
     out_routes : list of Route
         A list of Route objects representing all outgoing routes (this airport → destinations).
+    degree_in, degree_out : int
+        Cached in/out degree, filled in by network analysis.
+    betweenness : float
+        Betweenness centrality score, filled in by network analysis.
+    resilience_score : float
+        Disruption-resilience score, filled in by network analysis.
     """
+    # __slots__ avoids a per-instance __dict__ (~100+ bytes each); at ~7k
+    # airports that is a real memory saving and attribute access gets faster.
+    __slots__ = ("code", "name", "city", "country", "lat", "lon",
+                 "out_routes", "in_routes",
+                 "degree_in", "degree_out", "betweenness", "resilience_score")
+
     def __init__(self, code, name, city, country, lat, lon):
         self.code = code
         self.name = name
@@ -43,6 +200,10 @@ class Airport:
         self.lon = lon
         self.out_routes = []
         self.in_routes = []
+        self.degree_in = 0
+        self.degree_out = 0
+        self.betweenness = 0.0
+        self.resilience_score = 0.0
 
     def add_inbound_route(self, route):
         """Register a Route object as an inbound connection to this airport."""
@@ -53,6 +214,54 @@ class Airport:
         self.out_routes.append(route)
 
 
+class _AirportTable:
+    """
+    Dict-like view over FlightNetwork's columnar airport storage.
+
+    The airport data itself lives in parallel NumPy arrays on the network
+    (codes, names, cities, countries, lats, lons); this table builds an
+    Airport object on demand when one is looked up, instead of keeping ~7k
+    Python objects alive permanently. It supports the mapping operations
+    the rest of the code (and the notebooks) use: membership, indexing,
+    get, iteration over codes, keys/values/items and len.
+    """
+
+    def __init__(self, network):
+        self._net = network
+
+    def __contains__(self, code):
+        return code in self._net.code_to_idx
+
+    def __getitem__(self, code):
+        net = self._net
+        i = net.code_to_idx[code]
+        airport = Airport(code, net.names[i], net.cities[i], net.countries[i],
+                          float(net.lats[i]), float(net.lons[i]))
+        airport.out_routes = net.outbound(code)
+        airport.in_routes = net.inbound(code)
+        return airport
+
+    def get(self, code, default=None):
+        if code in self._net.code_to_idx:
+            return self[code]
+        return default
+
+    def __iter__(self):
+        return iter(self._net.idx_to_code)
+
+    def __len__(self):
+        return len(self._net.idx_to_code)
+
+    def keys(self):
+        return self._net.idx_to_code
+
+    def values(self):
+        return (self[code] for code in self._net.idx_to_code)
+
+    def items(self):
+        return ((code, self[code]) for code in self._net.idx_to_code)
+
+
 class Route:
     """
     Represents a directed airline route (edge) connecting two airports.
@@ -71,11 +280,80 @@ class Route:
         IATA code of the destination airport.
     airline : str
         Airline code operating this route (e.g., "DL", "UA").
+    distance : float or None
+        Great-circle distance between the endpoints, if computed.
+    flight_count, avg_delay, cancel_rate, weather_cancel_rate : statistics
+        Performance statistics, filled in from BTS/On-Time data.
+    weight : float
+        Edge weight for weighted pathfinding (default 1.0).
+    is_high_risk : bool
+        Whether this route is flagged as disruption-prone.
+    active : bool
+        Whether the route is currently active (used by disruption simulation).
     """
+    # Same __slots__ treatment as Airport; with ~67k Route instances the
+    # per-instance __dict__ overhead would be several megabytes.
+    __slots__ = ("src", "dst", "airline",
+                 "distance", "flight_count", "avg_delay", "cancel_rate",
+                 "weather_cancel_rate", "weight", "is_high_risk", "active")
+
     def __init__(self, src, dst, airline):
         self.src = src
         self.dst = dst
         self.airline = airline
+        self.distance = None
+        self.flight_count = 0
+        self.avg_delay = None
+        self.cancel_rate = None
+        self.weather_cancel_rate = None
+        self.weight = 1.0
+        self.is_high_risk = False
+        self.active = True
+
+
+class _RouteTable:
+    """
+    Dict-like view over FlightNetwork's columnar route storage.
+
+    Routes live in flat parallel arrays on the network (route_src/route_dst
+    id arrays plus the airline column); this table keeps the familiar
+    (src, dst, airline) -> Route mapping interface by building Route objects
+    on demand from their row, instead of allocating ~67k tiny objects up
+    front.
+    """
+
+    def __init__(self, network):
+        self._net = network
+
+    def __contains__(self, key):
+        return key in self._net._route_index
+
+    def __getitem__(self, key):
+        return self._net._route_at(self._net._route_index[key])
+
+    def get(self, key, default=None):
+        row = self._net._route_index.get(key)
+        if row is None:
+            return default
+        return self._net._route_at(row)
+
+    def __iter__(self):
+        return iter(self._net._route_index)
+
+    def __len__(self):
+        return len(self._net._route_index)
+
+    def keys(self):
+        return self._net._route_index.keys()
+
+    def values(self):
+        net = self._net
+        return (net._route_at(row) for row in net._route_index.values())
+
+    def items(self):
+        net = self._net
+        return ((key, net._route_at(row))
+                for key, row in net._route_index.items())
 
 
 class FlightNetwork:
@@ -89,43 +367,99 @@ class FlightNetwork:
 
     Attributes
     ----------
-    airports : dict[str, Airport]
-        Mapping from IATA code to Airport object.
-    routes : dict[tuple(str, str, str), Route]
-        Mapping from (src, dst, airline) → Route object.
-        Keys allow multiple airlines to operate the same pair of airports.
-
-    adjacency : dict[str, set[str]]
-        A simpler adjacency list (src → set of dst airport codes) used for BFS, 
-        pathfinding, or unweighted analysis.
+    airports : _AirportTable
+        Dict-like mapping from IATA code to Airport. The underlying data is
+        columnar (see codes/names/.../lons below); Airport objects are built
+        on demand rather than kept alive per node.
+    routes : _RouteTable
+        Dict-like mapping from (src, dst, airline) → Route. Keys allow
+        multiple airlines to operate the same pair of airports; the data is
+        stored columnar (see route_src/route_dst/route_airlines) and Route
+        objects are built on demand.
+    route_src, route_dst : numpy int32 arrays
+        Endpoint airport ids of each deduplicated route row.
+    route_airlines : list
+        Airline code of each route row.
+
+    adjacency : dict[str, tuple[str, ...]]
+        A simpler adjacency list (src → deduplicated dst airport codes,
+        frozen to a tuple) used for summaries and unweighted analysis.
+
+    codes : numpy object array
+        Airport IATA codes in id order (parallel to the other columns).
+    names, cities, countries : numpy object arrays
+        Airport metadata columns in id order.
+    lats, lons : numpy float32 arrays
+        Airport coordinates in id order. Bulk numeric work (vectorized
+        haversine, KD-tree lookups, centrality) runs over these columns
+        instead of looping over Airport objects.
+    code_to_idx : dict[str, int]
+        Mapping from IATA code to a dense integer id (row in the CSR arrays).
+    idx_to_code : list[str]
+        Inverse mapping, integer id → IATA code.
+    indptr, indices : numpy int32 arrays
+        Compressed sparse row (CSR) form of the adjacency: the neighbors of
+        airport i are `indices[indptr[i]:indptr[i+1]]`. BFS runs over these
+        contiguous integer arrays instead of hashing strings into sets.
     """
     def __init__(self):
-        self.airports = {}
-        self.routes = {}
+        self.airports = _AirportTable(self)
+        self.routes = _RouteTable(self)
+        self.route_src = np.empty(0, dtype=np.int32)
+        self.route_dst = np.empty(0, dtype=np.int32)
+        self.route_airlines = []
+        self._route_index = {}
         self.adjacency = {}
+        self.codes = None
+        self.names = None
+        self.cities = None
+        self.countries = None
+        self.lats = None
+        self.lons = None
+        self.code_array = np.empty(0, dtype="S4")
+        self.code_to_idx = {}
+        self._out_routes_by_code = None
+        self._in_routes_by_code = None
+        self.idx_to_code = []
+        self.indptr = None
+        self.indices = None
+        self._summary_cache = {}
+        self._bfs_cache = {}
+        self._parent_by_src = {}
         
     def load_airports(self, airports_csv):
         """
         Load airports from CSV and create Airport objects.
         Only airports with valid IATA codes should be included.
         """    
-        # Read airports.csv
-        airport_df = pd.read_csv(airports_csv)
-        airport_df = airport_df[airport_df["IATA"].notna() & (airport_df["IATA"] != r"\N")]
-
-        self.airports = {}
-
-        for _, row in airport_df.iterrows():
-            code = row["IATA"]
-            airport = Airport(
-                code=code,
-                name=row["Name"],
-                city=row["City"],
-                country=row["Country"],
-                lat=float(row["Latitude"]),
-                lon=float(row["Longitude"]),
-            )
-            self.airports[code] = airport
+        # Read just the columns the network needs (polars if available,
+        # pandas otherwise) as one NumPy array per column.
+        cols = _read_csv_columns(
+            airports_csv,
+            columns=["IATA", "Name", "City", "Country", "Latitude", "Longitude"],
+            float_cols=("Latitude", "Longitude"),
+            dropna_cols=("IATA",),
+        )
+
+        # The codes are interned: "LAX" shows up in hundreds of route rows,
+        # and interned strings make every dict/set hit a pointer compare.
+        codes = [sys.intern(code) for code in cols["IATA"]]
+
+        # Structure-of-arrays storage: one column per attribute, in dense id
+        # order, instead of ~7k long-lived Airport objects. self.airports is
+        # a dict-like view that builds Airport objects on demand.
+        self.codes = np.array(codes, dtype=object)
+        self.names = np.asarray(cols["Name"], dtype=object)
+        self.cities = np.asarray(cols["City"], dtype=object)
+        self.countries = np.asarray(cols["Country"], dtype=object)
+        self.lats = cols["Latitude"].astype(np.float32)
+        self.lons = cols["Longitude"].astype(np.float32)
+        self.code_to_idx = {code: i for i, code in enumerate(codes)}
+        self.idx_to_code = codes
+
+        # Fixed-width byte copy of the codes for vectorized bulk membership
+        # tests (np.isin works on 'S4' without per-element Python hashing).
+        self.code_array = np.asarray(codes, dtype="S4")
 
         print("nodes (airports):", len(self.airports))
 
@@ -136,45 +470,200 @@ class FlightNetwork:
         Validate that both src and dst airport codes exist in self.airports.
         Update inbound/outbound relationships and adjacency list.
         """
-        # Read routes.csv
-        routes_df = pd.read_csv(routes_csv)
+        # Read routes.csv the same way as load_airports, dropping rows whose
+        # source/destination IATA is NA.
+        cols = _read_csv_columns(
+            routes_csv,
+            columns=["Airline", "Source Airport", "Destination Airport"],
+            dropna_cols=("Source Airport", "Destination Airport"),
+        )
+
+        # Interned codes hit the interned Airport keys with a pointer compare.
+        srcs = [sys.intern(s) for s in cols["Source Airport"]]
+        dsts = [sys.intern(d) for d in cols["Destination Airport"]]
+        airlines = [sys.intern(a) if isinstance(a, str) else a
+                    for a in cols["Airline"]]
+
+        # Columnar route storage: the raw rows are validated, id-mapped and
+        # deduplicated in bulk with NumPy instead of a per-row dict check.
+        # Codes are mapped to dense ids by binary search against the sorted
+        # 'S4' code array; airlines are factorized to ints; np.unique on the
+        # (src, dst, airline) id triples then dedups everything in one C
+        # call. return_index keeps the first occurrence of each triple so
+        # route order matches the old per-row scan. Per-airport route lists
+        # are not built here at all; they are grouped lazily on first
+        # outbound()/inbound() access.
+        order = np.argsort(self.code_array)
+        sorted_codes = self.code_array[order]
+
+        def to_ids(code_list):
+            raw = np.asarray(code_list, dtype="S4")
+            pos = np.minimum(np.searchsorted(sorted_codes, raw),
+                             len(sorted_codes) - 1)
+            return order[pos].astype(np.int32), sorted_codes[pos] == raw
+
+        if len(sorted_codes) and len(srcs):
+            src_all, src_ok = to_ids(srcs)
+            dst_all, dst_ok = to_ids(dsts)
+            airline_all = pd.factorize(np.asarray(airlines, dtype=object))[0]
+
+            valid = np.flatnonzero(src_ok & dst_ok)
+            triples = np.column_stack((src_all[valid], dst_all[valid],
+                                       airline_all[valid]))
+            first = np.unique(triples, axis=0, return_index=True)[1]
+            first.sort()
+            rows = valid[first]
+        else:
+            src_all = dst_all = np.empty(0, dtype=np.int32)
+            rows = np.empty(0, dtype=np.intp)
+
+        self.route_src = src_all[rows]
+        self.route_dst = dst_all[rows]
+        self.route_airlines = [airlines[i] for i in rows.tolist()]
+
+        # The (src, dst, airline) -> row index serves keyed lookup through
+        # self.routes (rows are already unique at this point).
+        route_index = {(srcs[i], dsts[i], airlines[i]): row
+                       for row, i in enumerate(rows.tolist())}
+        self._route_index = route_index
+        self._out_routes_by_code = None
+        self._in_routes_by_code = None
 
-        # Drop source/dest airport IATA = NA
-        routes_df = routes_df[
-            routes_df["Source Airport"].notna()
-            & routes_df["Destination Airport"].notna()
-            & (routes_df["Source Airport"] != r"\N")
-            & (routes_df["Destination Airport"] != r"\N")]
+        print("routes:", len(self.routes))
 
-        self.routes = {}
 
-        for _, row in routes_df.iterrows():
-            src = row["Source Airport"]
-            dst = row["Destination Airport"]
-            airline = row["Airline"]
+    def _route_at(self, row):
+        """Build the Route view for one row of the columnar route storage."""
+        idx_to_code = self.idx_to_code
+        return Route(idx_to_code[self.route_src[row]],
+                     idx_to_code[self.route_dst[row]],
+                     self.route_airlines[row])
 
-            if src in self.airports and dst in self.airports:
-                key = (src, dst, airline)
-                if key not in self.routes:
-                    route = Route(src, dst, airline)
-                    self.routes[key] = route
 
-                    src_airport = self.airports[src]
-                    dst_airport = self.airports[dst]
+    def _group_routes_by_airport(self):
+        """
+        Group route row ids by their endpoint codes (one pass, cached).
 
-                    src_airport.add_outbound_route(route)
-                    dst_airport.add_inbound_route(route)
+        Runs on the first outbound()/inbound() call rather than during
+        load_routes, so workloads that never ask for per-airport route lists
+        (pathfinding, plotting) skip the grouping cost entirely.
+        """
+        out_by_code = defaultdict(list)
+        in_by_code = defaultdict(list)
+        idx_to_code = self.idx_to_code
 
-        print("routes:", len(self.routes))
+        for row, (src_idx, dst_idx) in enumerate(zip(self.route_src.tolist(),
+                                                     self.route_dst.tolist())):
+            out_by_code[idx_to_code[src_idx]].append(row)
+            in_by_code[idx_to_code[dst_idx]].append(row)
+
+        self._out_routes_by_code = out_by_code
+        self._in_routes_by_code = in_by_code
+
+
+    def outbound(self, code):
+        """
+        Return the Route objects departing from an airport code.
+
+        Parameters
+        ----------
+        code : str
+            IATA code (already normalized, e.g. "LAX").
+
+        Returns
+        -------
+        list of Route
+        """
+        if self._out_routes_by_code is None:
+            self._group_routes_by_airport()
+        rows = self._out_routes_by_code.get(code, ())
+        return [self._route_at(row) for row in rows]
+
+
+    def inbound(self, code):
+        """
+        Return the Route objects arriving at an airport code.
+
+        Parameters
+        ----------
+        code : str
+            IATA code (already normalized, e.g. "LAX").
+
+        Returns
+        -------
+        list of Route
+        """
+        if self._in_routes_by_code is None:
+            self._group_routes_by_airport()
+        rows = self._in_routes_by_code.get(code, ())
+        return [self._route_at(row) for row in rows]
 
 
     def build_adjacency(self):
-        self.adjacency = defaultdict(set)
-        for route in self.routes.values():
-            self.adjacency[route.src].add(route.dst)
+        self._build_csr()
+
+        # The adjacency is read-only once built; frozen tuples iterate
+        # faster than sets (no hash-table probing) and use far less memory.
+        # Slicing the already-deduplicated CSR rows is cheaper than
+        # re-accumulating a dict of sets from the raw route list.
+        idx_to_code = self.idx_to_code
+        dst_codes = self.codes.take(self.indices)
+        bounds = self.indptr.tolist()
+        adjacency = {}
+        for i in range(len(idx_to_code)):
+            lo, hi = bounds[i], bounds[i + 1]
+            if hi > lo:
+                adjacency[idx_to_code[i]] = tuple(dst_codes[lo:hi])
+        self.adjacency = adjacency
+        self._summary_cache.clear()
+        self._bfs_cache.clear()
+        self._parent_by_src.clear()
+
+
+    def _build_csr(self):
+        """
+        Compile the route id arrays into CSR (compressed sparse row) form.
 
+        Airports get dense integer ids (code_to_idx / idx_to_code); the
+        neighbors of airport i then live in indices[indptr[i]:indptr[i+1]].
+        Traversals over contiguous int32 arrays are much faster than walking
+        a dict of string sets.
 
-    def build_from_openflights(self, airports_csv, routes_csv, airlines_csv = None):
+        Construction is pure NumPy: lexsort the (src, dst) id pairs, drop
+        consecutive duplicates with a boolean mask (parallel routes flown by
+        several airlines collapse to one edge), then bincount/cumsum the
+        sources into the row pointers. No per-edge Python loop is involved.
+        """
+        self.code_to_idx = {code: i for i, code in enumerate(self.airports)}
+        self.idx_to_code = list(self.airports)
+
+        n = len(self.airports)
+        order = np.lexsort((self.route_dst, self.route_src))
+        src_sorted = self.route_src[order]
+        dst_sorted = self.route_dst[order]
+        if len(src_sorted):
+            keep = np.empty(len(src_sorted), dtype=bool)
+            keep[0] = True
+            keep[1:] = ((src_sorted[1:] != src_sorted[:-1])
+                        | (dst_sorted[1:] != dst_sorted[:-1]))
+            src_sorted = src_sorted[keep]
+            dst_sorted = dst_sorted[keep]
+
+        indptr = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(np.bincount(src_sorted, minlength=n), out=indptr[1:])
+
+        self.indptr = indptr
+        self.indices = dst_sorted.astype(np.int32)
+
+        # Out-degrees fall straight out of the CSR row pointers; keep both
+        # the array (id order) and a by-code dict so callers don't rebuild
+        # them per plot/analysis call.
+        self.out_degree = np.diff(indptr)
+        self.out_degree_by_code = dict(zip(self.idx_to_code,
+                                           self.out_degree.tolist()))
+
+
+    def build_from_openflights(self, airports_csv, routes_csv):
         self.load_airports(airports_csv)
         self.load_routes(routes_csv)
         self.build_adjacency()
@@ -200,8 +689,15 @@ class FlightNetwork:
         if airport is None:
             return None
 
+        # Interactive exploration tends to ask about the same airport over
+        # and over; the summary only changes when the adjacency is rebuilt
+        # (build_adjacency clears this cache).
+        cached = self._summary_cache.get(airport.code)
+        if cached is not None:
+            return cached
+
         # Out going route (from adjacency)
-        outgoing = self.adjacency.get(code, set())
+        outgoing = self.adjacency.get(airport.code, ())
 
         dest_names = []
         for dst_id in list(outgoing)[:5]:
@@ -217,6 +713,7 @@ class FlightNetwork:
             f"Sample destinations: {', '.join(dest_names) if dest_names else 'None'}"
         )
 
+        self._summary_cache[airport.code] = summary
         return summary
 
 
@@ -237,9 +734,46 @@ class FlightNetwork:
         if code is None:
             return None
 
-        norm_code = code.strip().upper()
+        # Fast path: codes are almost always already normalized ("LAX"),
+        # so skip the strip/upper allocations when the code is a known key.
+        airport = self.airports.get(code)
+        if airport is not None:
+            return airport
+
+        return self.airports.get(_norm(code), None)
+
+
+    def contains_many(self, codes):
+        """
+        Vectorized membership test for a batch of IATA codes.
+
+        One np.isin call over the fixed-width code array replaces a Python
+        loop of dict lookups — handy for bulk queries like checking a whole
+        route file or disruption scenario against the network at once.
+
+        Parameters
+        ----------
+        codes : iterable of str
+            IATA codes (already normalized, e.g. "LAX").
+
+        Returns
+        -------
+        numpy.ndarray of bool
+            One flag per input code, in input order.
+        """
+        query = np.asarray(list(codes), dtype="S4")
+        return np.isin(query, self.code_array)
+
+
+    def _get_airport_raw(self, code):
+        """
+        Direct airport lookup with no normalization.
 
-        return self.airports.get(norm_code, None)
+        For internal call sites whose codes are already stripped/uppercased
+        (BFS endpoints, codes coming out of find_shortest_path_bfs), this
+        skips the normalization work get_airport would redo per call.
+        """
+        return self.airports.get(code)
     
 
     def find_shortest_path_bfs(self, src_code: str, dst_code: str) -> list[str] | None:
@@ -263,48 +797,48 @@ class FlightNetwork:
         if src_code is None or dst_code is None:
             return None
 
-        src = src_code.strip().upper()
-        dst = dst_code.strip().upper()
+        src = _norm(src_code)
+        dst = _norm(dst_code)
 
-        if self.get_airport(src) is None or self.get_airport(dst) is None:
+        # Membership tests only: building Airport views here would trigger
+        # the lazy per-airport route grouping just to check existence.
+        if src not in self.airports or dst not in self.airports:
             return None
 
         if src == dst:
             return [src]
 
-        visited = set()
-        parent: dict[str, str] = {}
-        q = deque()
-
-        visited.add(src)
-        q.append(src)
-
-        found = False
-
-        while q:
-            current = q.popleft()
-            for neighbor in self.adjacency.get(current, set()):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    parent[neighbor] = current
-                    if neighbor == dst:
-                        found = True
-                        q.append(neighbor)
-                        break
-                    q.append(neighbor)
-            if found:
-                break
-
-        if not found:
+        # Repeat queries for the same pair are O(1); the caches are cleared
+        # whenever build_adjacency runs.
+        key = (src, dst)
+        if key in self._bfs_cache:
+            cached = self._bfs_cache[key]
+            return list(cached) if cached is not None else None
+
+        if self.indptr is None:
+            self._build_csr()
+
+        src_idx = self.code_to_idx[src]
+        dst_idx = self.code_to_idx[dst]
+
+        # One full BFS from src answers every destination, so the parent
+        # array is cached per source: a later query from the same source to
+        # a different airport is just a walk up the parent chain. Passing -1
+        # as the kernel's destination disables its early exit.
+        parent = self._parent_by_src.get(src_idx)
+        if parent is None:
+            parent = np.empty(len(self.code_to_idx), dtype=np.int32)
+            _bfs_csr(self.indptr, self.indices, src_idx, -1, parent)
+            self._parent_by_src[src_idx] = parent
+
+        if parent[dst_idx] == -1:
+            self._bfs_cache[key] = None
             return None
 
-        path = [dst]
-        while path[-1] != src:
-            prev = parent[path[-1]]
-            path.append(prev)
-
-        path.reverse()
-        return path
+        path_ids = _path_from_parent(parent, src_idx, dst_idx)
+        result = self.codes.take(path_ids).tolist()
+        self._bfs_cache[key] = result
+        return list(result)
 
 
     def format_path(self, path: list[str] | None) -> str:
@@ -328,7 +862,7 @@ class FlightNetwork:
         segments = []
 
         for code in path:
-            airport = self.get_airport(code)
+            airport = self._get_airport_raw(code)
             if airport is not None:
                 segments.append(f"{code} ({airport.city}, {airport.country})")
             else:
@@ -340,10 +874,12 @@ class FlightNetwork:
 
     def plot_path(self, path: list[str] | None, figsize: tuple[int, int] = (8, 6)) -> None:
         """
-        Visualize a path using NetworkX and matplotlib.
+        Visualize a path with direct matplotlib calls.
 
-        The path is drawn as a small directed graph. If latitude and longitude
-        are available, they are used as the layout coordinates.
+        If latitude and longitude are available, they are used as the layout
+        coordinates; otherwise hops are spaced evenly along a line. A path
+        graph is a handful of points and segments, so drawing them directly
+        skips the NetworkX graph construction and rendering layers entirely.
 
         Parameters
         ----------
@@ -356,29 +892,30 @@ class FlightNetwork:
             print("No valid path to plot.")
             return
 
-        G = nx.DiGraph()
-
-        for code in path:
-            G.add_node(code)
-
-        for i in range(len(path) - 1):
-            src = path[i]
-            dst = path[i + 1]
-            G.add_edge(src, dst)
-
-        pos = {}
+        coords = []
         for code in path:
-            airport = self.get_airport(code)
+            airport = self._get_airport_raw(code)
             if airport is not None and airport.lat is not None and airport.lon is not None:
-                pos[code] = (airport.lon, airport.lat)
+                coords.append((airport.lon, airport.lat))
 
-        if len(pos) != len(path):
-            pos = nx.spring_layout(G, seed=42)
+        if len(coords) == len(path):
+            xs = [c[0] for c in coords]
+            ys = [c[1] for c in coords]
+        else:
+            # Missing coordinates: fall back to even spacing along a line.
+            xs = list(range(len(path)))
+            ys = [0.0] * len(path)
 
         plt.figure(figsize=figsize)
-        nx.draw_networkx_nodes(G, pos, node_size=500)
-        nx.draw_networkx_edges(G, pos, arrowstyle="->", arrowsize=15)
-        nx.draw_networkx_labels(G, pos, font_size=8)
+        plt.plot(xs, ys, "-o", color="#1f78b4", markersize=12, zorder=2)
+
+        for i in range(len(path) - 1):
+            plt.annotate("", xy=(xs[i + 1], ys[i + 1]), xytext=(xs[i], ys[i]),
+                         arrowprops=dict(arrowstyle="->", color="gray"))
+
+        for code, x, y in zip(path, xs, ys):
+            plt.annotate(code, (x, y), textcoords="offset points",
+                         xytext=(0, 10), ha="center", fontsize=8)
 
         plt.title("Shortest Path between Airports")
         plt.axis("off")
@@ -401,54 +938,66 @@ class FlightNetwork:
         figsize : tuple[int, int]
             Size of the matplotlib figure.
         """
-        degree_out = {code: len(self.adjacency.get(code, set()))
-                      for code in self.airports.keys()}
-
-        top_codes = sorted(degree_out, key=degree_out.get, reverse=True)[:top_n]
-
-        G = nx.DiGraph()
-        for code in top_codes:
-            G.add_node(code)
-
-        for (src, dst, airline), route in self.routes.items():
-            if src in top_codes and dst in top_codes:
-                G.add_edge(src, dst)
-
-        if G.number_of_nodes() == 0:
+        if self.indptr is None:
+            self._build_csr()
+
+        # Degrees were precomputed when the CSR was built; argpartition
+        # selects the N largest in O(n) (vs. a full O(n log n) sort) and
+        # only those N get the small ordering sort. Then walk just the CSR
+        # rows of the selected hubs instead of scanning every route.
+        deg = self.out_degree
+        k = min(top_n, len(deg))
+        if k < len(deg):
+            top_ids = np.argpartition(-deg, k - 1)[:k]
+        else:
+            top_ids = np.arange(len(deg))
+        top_ids = top_ids[np.argsort(-deg[top_ids])]
+        top_set = set(top_ids.tolist())
+
+        idx_to_code = self.idx_to_code
+        indptr = self.indptr
+        indices = self.indices
+
+        if len(top_ids) == 0:
             print("No nodes to plot in hub network.")
             return
 
+        G = nx.DiGraph()
+        for i in top_ids:
+            G.add_node(idx_to_code[i])
+
+        for i in top_ids.tolist():
+            src = idx_to_code[i]
+            for j in indices[indptr[i]:indptr[i + 1]]:
+                if j in top_set:
+                    G.add_edge(src, idx_to_code[j])
+
+        # The graph is only built for the layout; rendering goes straight
+        # through matplotlib. One scatter call plus one LineCollection is
+        # far cheaper than nx.draw_networkx_* creating a patch per edge.
         pos = nx.spring_layout(G, k=0.3, iterations=100, seed=42)
 
-        node_sizes = [50 + degree_out.get(code, 0) * 2 for code in G.nodes()]
-
-        plt.figure(figsize=figsize)
-
-        nx.draw_networkx_nodes(
-            G, pos,
-            node_size=node_sizes,
-            node_color="#1f78b4",
-            edgecolors="black",
-            alpha=0.9,
-        )
-
-        nx.draw_networkx_edges(
-            G, pos,
-            arrowstyle="->",
-            arrowsize=10,
-            width=0.5,
-            alpha=0.5,
-        )
-
-        nx.draw_networkx_labels(
-            G, pos,
-            font_size=8,
-            font_color="white",
-            font_weight="bold",
-        )
-
-        plt.title(f"Top {top_n} Airport Hubs (by outbound routes)", fontsize=14)
-        plt.axis("off")
+        codes = list(G.nodes())
+        xs = [pos[code][0] for code in codes]
+        ys = [pos[code][1] for code in codes]
+        node_sizes = [50 + self.out_degree_by_code.get(code, 0) * 2
+                      for code in codes]
+        segments = [(pos[src], pos[dst]) for src, dst in G.edges()]
+
+        fig, ax = plt.subplots(figsize=figsize)
+        ax.add_collection(LineCollection(segments, colors="gray",
+                                         linewidths=0.5, alpha=0.5, zorder=1))
+        ax.scatter(xs, ys, s=node_sizes, c="#1f78b4",
+                   edgecolors="black", alpha=0.9, zorder=2)
+
+        for code, x, y in zip(codes, xs, ys):
+            ax.annotate(code, (x, y), ha="center", va="center",
+                        fontsize=8, color="white", weight="bold")
+
+        ax.set_title(f"Top {top_n} Airport Hubs (by outbound routes)",
+                     fontsize=14)
+        ax.set_axis_off()
+        ax.autoscale_view()
         plt.tight_layout()
         plt.show()
 